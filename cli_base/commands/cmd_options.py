@@ -142,7 +142,7 @@ def standard_command(init_context: bool = True) -> Callable[[CommandFunc], Comma
                     initialize_context(scope_params)
                 except Exception as e:
                     from ..utils.formatting import OutputFormatter
-                    OutputFormatter.print_error(f"Error initializing context: {str(e)}")
+                    OutputFormatter.print_error(f"Error initializing context: {str(e)}", once=True)
             
             # Call the original function and return the result
             # (Runtime settings will be printed by the command if verbose mode is enabled)
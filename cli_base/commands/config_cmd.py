@@ -64,7 +64,7 @@ def save_config(scope: str, file_path: Optional[str] = None):
     # For demonstration, we're just using the default config
     # In a real implementation, this would use current parameters from context
     try:
-        rt.save_config(rt.DEFAULT_CONFIG, scope)
+        rt.save_config(rt._fresh_default(), scope)
         OutputFormatter.print_success(f"Configuration saved to {scope} config.")
     except (ValueError, IOError) as e:
         OutputFormatter.print_error(str(e))
@@ -169,7 +169,8 @@ def import_config(from_scope: str, from_file: Optional[str], to_scope: str, to_f
                 # Merge source into destination
                 try:
                     dest_config = temp_settings.settings.get_config(dest_scope)
-                    merged_config = rt._deep_merge(dest_config, source_config)
+                    # Merge into a fresh dict so the loaded config stays unchanged if saving fails
+                    merged_config = rt._deep_merge(rt._deep_merge({}, dest_config), source_config)
                     temp_settings.settings.save_config(merged_config, dest_scope)
                 except FileNotFoundError:
                     # If destination file doesn't exist, create it with source config
@@ -183,7 +184,8 @@ def import_config(from_scope: str, from_file: Optional[str], to_scope: str, to_f
             else:
                 # Merge source into destination
                 dest_config = rt.get_config(dest_scope)
-                merged_config = rt._deep_merge(dest_config, source_config)
+                # Merge into a fresh dict so the loaded config stays unchanged if saving fails
+                merged_config = rt._deep_merge(rt._deep_merge({}, dest_config), source_config)
                 rt.save_config(merged_config, dest_scope)
         
         OutputFormatter.print_success("Configuration imported successfully.")
@@ -242,7 +244,7 @@ def reset_config(scope: str, file_path: Optional[str] = None):
             scope = "file"
         
         # Reset config to defaults
-        rt.save_config(rt.DEFAULT_CONFIG, scope)
+        rt.save_config(rt._fresh_default(), scope)
         OutputFormatter.print_success(f"{scope.capitalize()} configuration reset to defaults.")
     except (ValueError, IOError) as e:
         OutputFormatter.print_error(str(e))
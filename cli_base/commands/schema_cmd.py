@@ -6,7 +6,7 @@ Provides a visual representation of the command structure.
 import click
 from ..utils.context import ContextManager
 from ..utils.formatting import OutputFormatter
-from ..utils.command_registry import CommandRegistry
+from ..utils.command_registry import get_registry
 from .cmd_options import standard_command
 
 @click.group(name="schema")
@@ -25,17 +25,17 @@ def show_schema(command: str, verbose: bool, scope: str = None, file_path: str =
     ctx = ContextManager.initialize({"scope": scope, "file_path": file_path, "verbose": verbose})
     
     # Get command registry
-    registry = CommandRegistry.get_instance()
+    registry = get_registry()
     
     if command:
         # Show schema for specific command
         if registry.get_command(command):
-            command_schema = registry.get_schema(command)
+            command_schema = {command: registry.get_schema_for(command)}
             OutputFormatter.print_command_tree(command_schema)
         else:
             # Command not found
             OutputFormatter.print_error(f"Command not found: {command}")
     else:
         # Show schema for all commands
-        schema_data = registry.get_schema()
+        schema_data = registry.get_all_schemas()
         OutputFormatter.print_command_tree(schema_data)
\ No newline at end of file
@@ -6,7 +6,7 @@ from cli_base.commands.cmd_options import (
     json_format_option, json_input_argument, profile_name_option, 
     table_format_option, scope_options
 )
-from cli_base.utils.command_registry import CommandRegistry
+from cli_base.utils.command_registry import get_registry
 from cli_base.utils.profiles import ProfileManager
 from cli_base.commands.generic_profile_cmd import (
     create_profile, list_profiles, show_profile,
@@ -146,7 +146,7 @@ class ProfileCommandGenerator:
         use_cmd.__doc__ = self._get_help_text("use", f"Use a specific {self.name} profile as default.")
 
         # Register command with registry
-        registry = CommandRegistry.get_instance()
+        registry = get_registry()
         schema = registry.extract_schema_from_command(self.command_name, command_group)
         registry.register_command(self.command_name, command_group, schema)
         
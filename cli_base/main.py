@@ -55,8 +55,8 @@ if HAS_LANGCHAIN:
 # Add other profile command groups here
 
 # Now register all commands in the CommandRegistry
-from cli_base.utils.command_registry import CommandRegistry
-registry = CommandRegistry.get_instance()
+from cli_base.utils.command_registry import get_registry
+registry = get_registry()
 registry.register_commands_from_cli(cli)
 
 # Import settings system
@@ -64,6 +64,10 @@ from cli_base.utils.advanced_settings import get_parameter_value
 from cli_base.utils.context import initialize_context
 from cli_base.utils.param_resolver import ParameterResolver
 
+# Resolver passed to the settings by initialize_settings; reusing one instance
+# lets repeated calls with unchanged inputs keep the existing settings
+_SETTINGS_RESOLVER = ParameterResolver()
+
 
 @cli.command(name="help")
 @click.argument("command", required=False)
@@ -73,8 +77,8 @@ def help_command(command, subcommand):
     ctx = click.get_current_context()
     
     # Get command registry
-    from cli_base.utils.command_registry import CommandRegistry
-    registry = CommandRegistry.get_instance()
+    from cli_base.utils.command_registry import get_registry
+    registry = get_registry()
     
     if command:
         # Show help for a specific command
@@ -101,8 +105,8 @@ def initialize_settings():
     This function initializes the context manager with settings,
     enabling command-specific configurations and parameter resolution.
     """
-    # Create a parameter resolver
-    resolver = ParameterResolver()
+    # Use the shared parameter resolver
+    resolver = _SETTINGS_RESOLVER
     
     # Initialize with default settings first to ensure we have a base configuration
     scope_params = {"scope": "local"}  # Default to local scope
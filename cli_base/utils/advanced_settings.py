@@ -1,17 +1,114 @@
 """
 Advanced runtime settings class for CLI tool.
 Provides comprehensive parameter resolution for CLI commands.
+
+Settings are built on every CLI invocation, so this module deliberately avoids
+``copy.deepcopy``; where an independent copy is needed, copy only the dictionary
+level that is actually modified.
 """
 
 import os
+import sys
 import json
 import click
+from contextlib import contextmanager
+from functools import cached_property
 from pathlib import Path
-from typing import Dict, Any, Optional, List, Union, Set, Type
-import copy
+from typing import Dict, Any, Optional, List, Union, Set, Type, Iterator, Tuple
 
-from .param_resolver import ParameterResolver
+from .param_resolver import ParameterResolver, get_command_path
 from .context import initialize_context
+from .formatting import OutputFormatter
+
+# Use orjson for config parsing/serialization when it is installed
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+if HAS_ORJSON:
+    def _loads(data: bytes) -> Any:
+        return orjson.loads(data)
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+else:
+    def _loads(data: bytes) -> Any:
+        return json.loads(data)
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2).encode("utf-8")
+
+# Environment variable that disables the Click context walk (e.g. for batch tooling)
+SKIP_CLICK_CONTEXT_ENV = "CLI_BASE_SKIP_CLICK_CTX"
+
+# (global config path, local config dir) pairs already set up by _initialize_config_files
+_INITIALIZED_PATHS: Set[Tuple[Path, Path]] = set()
+
+
+def _load_json(path: Path) -> Dict[str, Any]:
+    """
+    Load a JSON configuration file.
+    
+    Raises:
+        FileNotFoundError: If the file does not exist
+        OSError: If the file cannot be read
+        json.JSONDecodeError: If the file does not contain valid JSON
+    """
+    # Read the whole file in one call (no exists() probe) and parse the bytes
+    return _loads(path.read_bytes())
+
+
+def _read_json(path: Path) -> Optional[Dict[str, Any]]:
+    """Load one configuration file for _load_configurations; None if it is missing or invalid JSON."""
+    try:
+        return _load_json(path)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+
+def _scan_scope_flags(argv: List[str]) -> Tuple[bool, bool, Optional[str]]:
+    """
+    Find the scope flags on a command line in a single pass.
+    
+    Returns:
+        Whether --global is present, whether --file is present, and the path
+        following the first --file (None if there is none)
+    """
+    use_global = False
+    use_file = False
+    file_path = None
+    for index, token in enumerate(argv, 1):
+        if token == '--global':
+            use_global = True
+        elif token == '--file' and not use_file:
+            use_file = True
+            if index < len(argv):
+                file_path = argv[index]
+    return use_global, use_file, file_path
+
+
+def _config_file_paths(cli_args: Dict[str, Any],
+                       argv_flags: Tuple[bool, bool, Optional[str]]) -> Tuple[Path, Path, Optional[Path]]:
+    """
+    Locate the configuration files for a set of CLI arguments.
+    
+    Args:
+        cli_args: Command-line arguments; a "file_path" entry names the named configuration
+        argv_flags: Scope flags found on the command line by _scan_scope_flags
+        
+    Returns:
+        The global, local and named configuration file paths (the latter None
+        if no named configuration file is given)
+    """
+    file_path = cli_args.get("file_path") or argv_flags[2]
+    return (
+        Path.home() / ".cli-tool" / "config.json",
+        Path.cwd() / ".cli-tool" / "config.json",
+        Path(os.path.expanduser(file_path)) if file_path else None,
+    )
+
 
 class AdvancedRTSettings:
     """
@@ -45,26 +142,32 @@ class AdvancedRTSettings:
         }
     }
     
-    def __init__(self, cli_args: Optional[Dict[str, Any]] = None, resolver: Optional[ParameterResolver] = None):
+    # Attribute holding the loaded configuration for each scope
+    _CONFIG_ATTR_BY_SCOPE = {
+        "global": "global_config",
+        "local": "local_config",
+        "file": "named_config",
+    }
+    
+    # Serialized template used to produce independent copies of DEFAULT_CONFIG
+    _DEFAULT_JSON = _dumps(DEFAULT_CONFIG)
+    
+    @staticmethod
+    def _fresh_default() -> Dict[str, Any]:
+        """Return a new, fully independent copy of DEFAULT_CONFIG."""
+        return _loads(AdvancedRTSettings._DEFAULT_JSON)
+    
+    def __init__(self, cli_args: Optional[Dict[str, Any]] = None, resolver: Optional[ParameterResolver] = None,
+                 command_context: Optional[Dict[str, Any]] = None):
         """
         Initialize advanced runtime settings with resolved parameters.
         
         Args:
             cli_args: Optional explicit command-line arguments to use
             resolver: Optional parameter resolver instance to use
+            command_context: Optional precomputed command context; when given,
+                             the Click context stack is not inspected
         """
-        # Initialize file paths
-        self.global_config_dir = Path.home() / ".cli-tool"
-        self.global_config_path = self.global_config_dir / "config.json"
-        self.local_config_dir = Path.cwd() / ".cli-tool"
-        self.local_config_path = self.local_config_dir / "config.json"
-        
-        # Initialize configuration containers
-        self.global_config = self.DEFAULT_CONFIG.copy()
-        self.local_config = self.DEFAULT_CONFIG.copy()
-        self.named_config = None
-        self.named_config_path = None
-        
         # Use the resolver if provided, or create a new one
         self.resolver = resolver or ParameterResolver()
         
@@ -83,73 +186,149 @@ class AdvancedRTSettings:
         # Store CLI arguments
         self.cli_args = resolved_args or {}
         
-        # Add system arguments to CLI args for better flag checking
-        import sys
-        self.cli_args["sys.argv"] = sys.argv
+        # Keep the raw command line and the scope flags found on it
+        self._argv = sys.argv
+        self._argv_flags = _scan_scope_flags(self._argv)
         
         # Verbose and quiet flags from CLI
         self.verbose = self.cli_args.get("verbose", False)
         self.quiet = self.cli_args.get("quiet", False)
         
-        # Runtime context for commands
-        self.context = {}
+        # Initialize file paths; the named configuration file comes from the
+        # file_path argument or a --file flag
+        self.global_config_path, self.local_config_path, self.named_config_path = _config_file_paths(
+            self.cli_args, self._argv_flags
+        )
+        self.global_config_dir = self.global_config_path.parent
+        self.local_config_dir = self.local_config_path.parent
+        
+        # Configuration file path for each valid scope
+        self._path_by_scope: Dict[str, Path] = {
+            "global": self.global_config_path,
+            "local": self.local_config_path,
+        }
+        if self.named_config_path:
+            self._path_by_scope["file"] = self.named_config_path
         
-        # Initialize configuration files and load settings
-        self._initialize_config_files()
-        self._load_configurations()
-        self._build_runtime_context()
+        # Memoized command-specific configurations, keyed by command path
+        self._cmd_cfg_cache: Dict[str, Dict[str, Any]] = {}
+        
+        # Writes deferred by batched_writes(), keyed by scope
+        self._batch_depth = 0
+        self._pending_saves: Dict[str, Tuple[Path, Dict[str, Any]]] = {}
         
-        # Store the original command context for later use
-        self.command_context = self._get_command_context()
+        # Use the precomputed command context if provided; otherwise it is
+        # computed from the Click context on first access
+        if command_context is not None:
+            self.command_context = command_context
         
-        # Apply command-specific configurations
-        self._apply_command_specific_config()
+        # Configuration files are loaded and the runtime context is built
+        # lazily, on first access to the properties below
+    
+    @cached_property
+    def global_config(self) -> Dict[str, Any]:
+        """Global configuration content, loaded on first access."""
+        self._load_configurations()
+        return self.__dict__["global_config"]
+    
+    @cached_property
+    def local_config(self) -> Dict[str, Any]:
+        """Local configuration content, loaded on first access."""
+        self._load_configurations()
+        return self.__dict__["local_config"]
+    
+    @cached_property
+    def named_config(self) -> Optional[Dict[str, Any]]:
+        """Named configuration content (None if not specified), loaded on first access."""
+        self._load_configurations()
+        return self.__dict__["named_config"]
+    
+    @cached_property
+    def context(self) -> Dict[str, Any]:
+        """Runtime context with the merged configuration, built on first access."""
+        self._build_runtime_context()
+        return self.__dict__["context"]
+    
+    @cached_property
+    def settings_dict(self) -> Dict[str, Any]:
+        """Direct reference to the "settings" section of the runtime context."""
+        return self.context.get("settings") or {}
+    
+    @cached_property
+    def _index(self) -> Dict[str, Any]:
+        """Flat parameter index used by get_param_value."""
+        return self._build_param_index()
+    
+    @cached_property
+    def _profile_index(self) -> Dict[Tuple[str, str], Dict[str, Any]]:
+        """Profiles from all lookup scopes keyed by (profile type, name); the highest precedence wins."""
+        index: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        for config in reversed(self._lookup_configs()):
+            for profile_type, profiles in (config.get("profiles") or {}).items():
+                if isinstance(profiles, dict):
+                    index.update(
+                        ((profile_type, name), profile)
+                        for name, profile in profiles.items() if profile is not None
+                    )
+        return index
+    
+    @cached_property
+    def _default_profile_index(self) -> Dict[str, str]:
+        """Default profile name per profile type from all lookup scopes; the highest precedence wins."""
+        index: Dict[str, str] = {}
+        for config in reversed(self._lookup_configs()):
+            index.update(
+                (profile_type, name)
+                for profile_type, name in (config.get("defaults") or {}).items() if name
+            )
+        return index
+    
+    def _invalidate_context(self) -> None:
+        """Drop the runtime context and everything derived from it; rebuilt on next access."""
+        for name in ("context", "settings_dict", "_index", "_profile_index", "_default_profile_index"):
+            self.__dict__.pop(name, None)
+        self._cmd_cfg_cache.clear()
     
     def _initialize_config_files(self):
         """Create default config directories and files if they don't exist."""
-        # Global config
-        if not self.global_config_dir.exists():
-            self.global_config_dir.mkdir(parents=True, exist_ok=True)
+        # Nothing to do if this process already set up these locations
+        key = (self.global_config_path, self.local_config_dir)
+        if key in _INITIALIZED_PATHS:
+            return
         
-        if not self.global_config_path.exists():
-            with open(self.global_config_path, 'w') as f:
-                json.dump(self.DEFAULT_CONFIG, f, indent=2)
+        # Global config; exclusive-create mode fails fast if the file exists
+        self.global_config_dir.mkdir(parents=True, exist_ok=True)
+        try:
+            with open(self.global_config_path, 'xb') as f:
+                f.write(self._DEFAULT_JSON)
+        except FileExistsError:
+            pass
         
         # Local config directory (but don't create file automatically)
-        if not self.local_config_dir.exists():
-            self.local_config_dir.mkdir(parents=True, exist_ok=True)
+        self.local_config_dir.mkdir(parents=True, exist_ok=True)
+        
+        _INITIALIZED_PATHS.add(key)
 
     def _load_configurations(self):
-        """Load all configuration files according to precedence rules."""
-        # Load global config
-        if self.global_config_path.exists():
-            try:
-                with open(self.global_config_path, 'r') as f:
-                    self.global_config = json.load(f)
-            except json.JSONDecodeError:
-                # Keep default if global config is invalid
-                pass
-        
-        # Load local config
-        if self.local_config_path.exists():
-            try:
-                with open(self.local_config_path, 'r') as f:
-                    self.local_config = json.load(f)
-            except json.JSONDecodeError:
-                # Keep default if local config is invalid
-                pass
-        
-        # Load named config if specified in CLI args
-        file_path = self.cli_args.get("file_path")
-        if file_path:
-            self.named_config_path = Path(os.path.expanduser(file_path))
-            if self.named_config_path.exists():
-                try:
-                    with open(self.named_config_path, 'r') as f:
-                        self.named_config = json.load(f)
-                except json.JSONDecodeError:
-                    # Keep None if named config is invalid
-                    self.named_config = None
+        """
+        Load all configuration files according to precedence rules.
+        
+        Configurations that are already loaded (or were assigned by save_config)
+        are left untouched.
+        """
+        loaded = self.__dict__
+        if "global_config" in loaded and "local_config" in loaded and "named_config" in loaded:
+            return
+        
+        # Global and local configs fall back to the defaults if the file is
+        # missing or invalid; a missing or invalid named config stays None
+        for attr_name, path in (("global_config", self.global_config_path),
+                                ("local_config", self.local_config_path)):
+            if attr_name not in loaded:
+                config = _read_json(path)
+                loaded[attr_name] = config if config is not None else self._fresh_default()
+        if "named_config" not in loaded:
+            loaded["named_config"] = _read_json(self.named_config_path) if self.named_config_path else None
     
     def _build_runtime_context(self):
         """
@@ -181,29 +360,11 @@ class AdvancedRTSettings:
             4. Default values
         """
         # Start with defaults
-        runtime_config = self.DEFAULT_CONFIG.copy()
+        runtime_config = self._fresh_default()
         
-        # Determine current scope by checking system arguments directly
+        # Determine current scope from the flags on the command line
         # This is more reliable than checking the resolved parameters
-        sys_argv = self.cli_args.get('sys.argv', [])
-        sys_argv_str = ' '.join(sys_argv)
-        
-        # Check for global flag
-        use_global = False
-        if '--global' in sys_argv_str:
-            use_global = True
-        
-        # Check for file flag
-        use_file = False
-        file_path = None
-        if '--file' in sys_argv_str:
-            use_file = True
-            try:
-                file_index = sys_argv.index('--file')
-                if file_index + 1 < len(sys_argv):
-                    file_path = sys_argv[file_index + 1]
-            except (ValueError, IndexError):
-                pass
+        use_global, use_file, file_path = self._argv_flags
         
         # Also check if scope and file parameters are set through other means
         current_scope = self.cli_args.get("scope", "local")
@@ -215,7 +376,6 @@ class AdvancedRTSettings:
             use_file = True
             file_path = cli_file_path
         
-        from .formatting import OutputFormatter
         if self.verbose:
             OutputFormatter.print_info(f"Using global: {use_global}")
             OutputFormatter.print_info(f"Using file: {use_file}, path: {file_path}")
@@ -224,21 +384,6 @@ class AdvancedRTSettings:
             
         has_file_option = use_file and file_path is not None
         
-        # If we have a file path but the named_config wasn't loaded, try loading it again
-        if has_file_option and file_path and not self.named_config:
-            self.named_config_path = Path(os.path.expanduser(file_path))
-            if self.named_config_path.exists():
-                try:
-                    with open(self.named_config_path, 'r') as f:
-                        self.named_config = json.load(f)
-                    if self.verbose:
-                        OutputFormatter.print_info(f"Loaded named config from {file_path}")
-                except (json.JSONDecodeError, IOError) as e:
-                    if self.verbose:
-                        OutputFormatter.print_error(f"Error loading named config: {str(e)}")
-                    # Keep None if named config is invalid or can't be read
-                    self.named_config = None
-        
         # Build config according to specified scope
         if has_file_option:
             # --file option: file -> local -> global -> defaults
@@ -249,7 +394,6 @@ class AdvancedRTSettings:
                 self.context = runtime_config
                 self.context["current_scope"] = "file"
                 if self.verbose:
-                    from .formatting import OutputFormatter
                     OutputFormatter.print_info(f"Using FILE configuration: {file_path}")
             else:
                 # If named config not found, fall back to standard precedence
@@ -258,7 +402,6 @@ class AdvancedRTSettings:
                 self.context = runtime_config
                 self.context["current_scope"] = "local"
                 if self.verbose:
-                    from .formatting import OutputFormatter
                     OutputFormatter.print_error(f"File configuration not found: {file_path}, using LOCAL configuration as fallback")
         elif use_global:
             # --global option: only global -> defaults
@@ -276,13 +419,20 @@ class AdvancedRTSettings:
             if self.verbose:
                 OutputFormatter.print_info("Using LOCAL configuration")
         
-        # Add CLI args to context
-        self.context["cli_args"] = self.cli_args
+        # Fill CLI arguments that were not given with the configuration of the
+        # current command, if any
+        command_path = self.command_context.get("command_path")
+        cmd_config = (runtime_config.get("commands") or {}).get(command_path) if command_path else None
+        if cmd_config:
+            self.cli_args.update({k: v for k, v in cmd_config.items() if self.cli_args.get(k) is None})
     
-    def _get_command_context(self) -> Dict[str, Any]:
+    @cached_property
+    def command_context(self) -> Dict[str, Any]:
         """
         Get information about the current command context.
         
+        Computed from the Click context stack on first access and cached.
+        
         Returns:
             Dictionary with command context information
         """
@@ -293,23 +443,19 @@ class AdvancedRTSettings:
             "root_command": None
         }
         
+        if os.environ.get(SKIP_CLICK_CONTEXT_ENV) == "1":
+            return command_context
+        
         try:
             # Try to get the current Click context
             ctx = click.get_current_context()
+            command_context["root_command"] = ctx.find_root().info_name or None
             
-            # Build command path and hierarchy
-            commands = []
-            current = ctx
-            
-            while current is not None:
-                if current.info_name and current.info_name != 'cli':
-                    commands.insert(0, current.info_name)
-                if current.parent is None and current.info_name:
-                    command_context["root_command"] = current.info_name
-                current = current.parent
-            
-            if commands:
-                command_context["command_path"] = ".".join(commands)
+            # Build the command hierarchy from the path shared with the parameter resolver
+            command_path = get_command_path(ctx)
+            if command_path:
+                commands = command_path.split(".")
+                command_context["command_path"] = command_path
                 command_context["command_name"] = commands[-1]
                 if len(commands) > 1:
                     command_context["parent_commands"] = commands[:-1]
@@ -319,83 +465,138 @@ class AdvancedRTSettings:
             
         return command_context
     
-    def _apply_command_specific_config(self) -> None:
+    def _build_param_index(self) -> Dict[str, Any]:
         """
-        Apply command-specific configurations to the runtime context.
+        Build a flat index of parameter values from all sources.
         
-        This method looks for command-specific configurations in the
-        effective configuration and applies them to the runtime context.
+        Sources are merged from lowest to highest precedence (general settings,
+        command-specific configuration, CLI arguments), skipping None values, so
+        a single dictionary lookup yields the winning value.
         """
-        if not self.command_context.get("command_path"):
-            return
-            
-        command_path = self.command_context["command_path"]
-        
-        # Check if there are command-specific configurations
-        if "commands" in self.context and command_path in self.context["commands"]:
-            # Get command-specific configurations
-            cmd_config = self.context["commands"][command_path]
-            
-            # Apply command-specific configurations to cli_args
-            for key, value in cmd_config.items():
-                # Only apply if not already set by CLI arguments
-                if key not in self.cli_args or self.cli_args[key] is None:
-                    self.cli_args[key] = value
+        index: Dict[str, Any] = {}
+        for source in (self.settings_dict, self.get_command_config(), self.cli_args):
+            index.update({k: v for k, v in source.items() if v is not None})
+        return index
     
     def get_config_path(self, scope: str) -> Path:
         """Get the path to the configuration file based on scope."""
-        if scope == "global":
-            return self.global_config_path
-        elif scope == "local":
-            return self.local_config_path
-        elif scope == "file" and self.named_config_path:
-            return self.named_config_path
-        else:
+        config_path = self._path_by_scope.get(scope)
+        if config_path is None:
             raise ValueError(f"Invalid scope: {scope}")
+        return config_path
 
     def get_config(self, scope: str) -> Dict[str, Any]:
         """Get configuration by scope."""
-        if scope == "global":
-            return self.global_config
-        elif scope == "local":
-            return self.local_config
-        elif scope == "file" and self.named_config:
-            return self.named_config
-        else:
+        attr_name = self._CONFIG_ATTR_BY_SCOPE.get(scope)
+        config = getattr(self, attr_name) if attr_name else None
+        if config is None:
             raise ValueError(f"Invalid scope: {scope}")
+        return config
 
     def save_config(self, config: Dict[str, Any], scope: str) -> None:
-        """Save configuration to the specified scope."""
+        """
+        Save configuration to the specified scope.
+        
+        Inside a batched_writes() block the file write is deferred until the
+        block exits.
+        """
         config_path = self.get_config_path(scope)
         
+        # The default files and directories are only created once something is
+        # written; read-only runs leave the filesystem untouched
+        self._initialize_config_files()
+        
+        if self._batch_depth:
+            self._pending_saves[scope] = (config_path, config)
+        else:
+            self._write_config_file(config_path, config)
+        
+        # Update runtime settings
+        setattr(self, self._CONFIG_ATTR_BY_SCOPE[scope], config)
+        
+        # The runtime context is rebuilt on next access
+        self._invalidate_context()
+    
+    @staticmethod
+    def _write_config_file(config_path: Path, config: Dict[str, Any]) -> None:
+        """
+        Write a configuration file atomically.
+        
+        The JSON is written to a temporary file next to the target, which then
+        replaces the target, so an interrupted write never leaves a truncated
+        configuration behind. The temporary file is flushed to disk before the
+        rename, so a crash cannot leave an empty file in its place, and it is
+        removed if the write fails. Saving content identical to the file on
+        disk is a no-op, leaving its modification time intact.
+        """
+        data = _dumps(config)
+        
+        # Skip the write when the file already holds exactly this content
+        try:
+            with open(config_path, 'rb') as f:
+                if f.read() == data:
+                    return
+        except OSError:
+            pass
+        
         # Ensure directory exists
         config_path.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(config_path, 'w') as f:
-            json.dump(config, f, indent=2)
+        tmp_path = config_path.with_name(config_path.name + ".tmp")
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, config_path)
+        finally:
+            # Already gone after a successful replace
+            tmp_path.unlink(missing_ok=True)
+    
+    @contextmanager
+    def batched_writes(self) -> Iterator["AdvancedRTSettings"]:
+        """
+        Group several configuration changes into a single write per scope.
         
-        # Update runtime settings
-        if scope == "global":
-            self.global_config = config
-        elif scope == "local":
-            self.local_config = config
-        elif scope == "file":
-            self.named_config = config
-        
-        # Rebuild runtime context
-        self._build_runtime_context()
+        Profile, setting and command configuration changes made inside the
+        block take effect in memory immediately, but each modified file is
+        written once, when the block exits. Blocks may be nested; the
+        outermost one flushes.
+        
+        Example:
+            with settings.batched_writes():
+                settings.set_setting("log_level", "debug", "local")
+                settings.update_command_config("generate.prompt", {"stream": True}, "local")
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._pending_saves:
+                pending, self._pending_saves = self._pending_saves, {}
+                for config_path, config in pending.values():
+                    self._write_config_file(config_path, config)
 
     def update_config(self, updates: Dict[str, Any], scope: str) -> Dict[str, Any]:
         """Update configuration with new values, preserving existing structure."""
         config = self.get_config(scope)
         
-        # Helper function to recursively update nested dictionaries
-        updated_config = self._deep_merge(config, updates)
+        # Merge into a fresh dict so the loaded config stays unchanged if saving fails
+        updated_config = self._deep_merge(self._deep_merge({}, config), updates)
         self.save_config(updated_config, scope)
         return updated_config
 
-    def get_effective_config(self) -> Dict[str, Any]:
-        """Get the effective configuration considering all precedence rules."""
+    def get_effective_config(self, include_cli_args: bool = False) -> Dict[str, Any]:
+        """
+        Get the effective configuration considering all precedence rules.
+        
+        Args:
+            include_cli_args: Also include the CLI arguments under "cli_args"
+                              (they are otherwise available as self.cli_args)
+        """
+        if include_cli_args:
+            return {**self.context, "cli_args": self.cli_args}
         return self.context
 
     def get_profile(self, profile_type: str, name: str) -> Dict[str, Any]:
@@ -425,33 +626,11 @@ class AdvancedRTSettings:
         Raises:
             ValueError: If the profile is not found in any scope
         """
-        # First check effective merged configuration
-        try:
-            return self.get_profile(profile_type, name)
-        except ValueError:
-            # Not in effective config, check specific scopes
-            current_scope = self.context.get("current_scope")
-            
-            # Try specific scopes based on current scope
-            if current_scope == "file":
-                # Try local scope next
-                try:
-                    if (profile_type in self.local_config["profiles"] and 
-                        name in self.local_config["profiles"][profile_type]):
-                        return self.local_config["profiles"][profile_type][name]
-                except (KeyError, TypeError):
-                    pass
-                    
-            # Finally try global scope
-            try:
-                if (profile_type in self.global_config["profiles"] and 
-                    name in self.global_config["profiles"][profile_type]):
-                    return self.global_config["profiles"][profile_type][name]
-            except (KeyError, TypeError):
-                pass
-                
-        # Not found in any scope
-        raise ValueError(f"Profile '{name}' not found in any configuration scope")
+        profile = self._profile_index.get((profile_type, name))
+        if profile is None:
+            # Not found in any scope
+            raise ValueError(f"Profile '{name}' not found in any configuration scope")
+        return profile
 
     def get_profiles(self, profile_type: str, scope: str = None) -> Dict[str, Dict[str, Any]]:
         """Get all profiles of a specific type, optionally filtered by scope."""
@@ -481,25 +660,17 @@ class AdvancedRTSettings:
         This method will first check the current scope, then fall back to local,
         then global configurations looking for a default profile of the given type.
         """
-        # First check effective merged configuration
-        default_profile = self.context["defaults"].get(profile_type)
-        if default_profile:
-            return default_profile
-            
-        # Check specific scopes if not found in effective configuration
-        current_scope = self.context.get("current_scope")
-        
-        # If current scope is "file" and no default was found, check local scope
-        if current_scope == "file" and not default_profile:
-            if profile_type in self.local_config["defaults"] and self.local_config["defaults"][profile_type]:
-                return self.local_config["defaults"][profile_type]
-                
-        # Finally check global scope if still not found
-        if not default_profile:
-            if profile_type in self.global_config["defaults"] and self.global_config["defaults"][profile_type]:
-                return self.global_config["defaults"][profile_type]
-                
-        return None
+        return self._default_profile_index.get(profile_type)
+    
+    def _lookup_configs(self) -> Tuple[Dict[str, Any], ...]:
+        """
+        Configurations searched by the *_from_any_scope lookups, highest
+        precedence first: the effective merged configuration, then the local
+        configuration (only when a named file is in use), then the global one.
+        """
+        if self.context.get("current_scope") == "file":
+            return (self.context, self.local_config, self.global_config)
+        return (self.context, self.global_config)
 
     def set_default_profile(self, profile_type: str, name: str, scope: str) -> None:
         """Set a profile as the default for its type in the specified scope."""
@@ -563,7 +734,7 @@ class AdvancedRTSettings:
 
     def get_setting(self, setting_name: str, default: Any = None) -> Any:
         """Get a setting value from the effective configuration."""
-        return self.context["settings"].get(setting_name, default)
+        return self.settings_dict.get(setting_name, default)
 
     def set_setting(self, setting_name: str, value: Any, scope: str) -> None:
         """Set a setting value in the specified scope."""
@@ -585,11 +756,14 @@ class AdvancedRTSettings:
         path = command_path or self.command_context.get("command_path")
         if not path:
             return {}
-            
-        if "commands" in self.context and path in self.context["commands"]:
-            return self.context["commands"][path]
         
-        return {}
+        cached = self._cmd_cfg_cache.get(path)
+        if cached is not None:
+            return cached
+        
+        result = self.context.get("commands", {}).get(path, {})
+        self._cmd_cfg_cache[path] = result
+        return result
     
     def get_param_value(self, param_name: str, default: Any = None) -> Any:
         """
@@ -601,6 +775,8 @@ class AdvancedRTSettings:
         3. General settings
         4. Provided default value
         
+        Sources whose value is None are skipped.
+        
         Args:
             param_name: The name of the parameter to get
             default: Default value to return if parameter not found
@@ -608,21 +784,7 @@ class AdvancedRTSettings:
         Returns:
             Parameter value from the most appropriate source
         """
-        # Check CLI arguments first
-        if param_name in self.cli_args:
-            return self.cli_args[param_name]
-        
-        # Check command-specific configuration
-        cmd_config = self.get_command_config()
-        if param_name in cmd_config:
-            return cmd_config[param_name]
-        
-        # Check general settings
-        if param_name in self.context["settings"]:
-            return self.context["settings"][param_name]
-        
-        # Return default value
-        return default
+        return self._index.get(param_name, default)
     
     def set_command_config(self, command_path: str, config: Dict[str, Any], scope: str) -> None:
         """
@@ -663,14 +825,9 @@ class AdvancedRTSettings:
         if "commands" not in effective_config:
             effective_config["commands"] = {}
         
-        # Ensure command configuration exists
-        if command_path not in effective_config["commands"]:
-            effective_config["commands"][command_path] = {}
-        
-        # Update command configuration
-        for key, value in updates.items():
-            effective_config["commands"][command_path][key] = value
-        
+        # Create the command configuration if needed and merge the updates in one step
+        effective_config["commands"].setdefault(command_path, {}).update(updates)
+
         # Save updated configuration
         self.save_config(effective_config, scope)
         
@@ -708,11 +865,6 @@ class AdvancedRTSettings:
         Returns:
             Dictionary representing the complete state, ready for JSON serialization
         """
-        import os
-        import sys
-        from pathlib import Path
-        import copy
-        
         # Initialize result dictionary with the most important information first
         result = {}
         
@@ -736,12 +888,12 @@ class AdvancedRTSettings:
         # Add CLI arguments if requested
         if include_cli_args:
             # Show command line arguments
-            result["sys_argv"] = sys.argv
+            result["sys_argv"] = self._argv
             
             # Show parsed CLI arguments
             result["cli_args"] = {
                 k: v for k, v in self.cli_args.items() 
-                if k != "sys.argv" and v is not None
+                if v is not None
             }
         
         # ===== File Paths =====
@@ -760,23 +912,18 @@ class AdvancedRTSettings:
         # ===== Effective Configuration =====
         # Add runtime context if requested (showing the effective configuration)
         if include_context:
-            # Make a deep copy to avoid modifying the original
-            context_copy = copy.deepcopy(self.context)
-            
-            # Remove CLI args if not requested (they'll be added separately)
-            if not include_cli_args and "cli_args" in context_copy:
-                del context_copy["cli_args"]
+            context_copy = self.context
             
             # Show only the most important parts of the context
             result["effective_config"] = {}
             
             # Add settings
             if "settings" in context_copy:
-                result["effective_config"]["settings"] = context_copy["settings"]
+                result["effective_config"]["settings"] = dict(context_copy["settings"])
                 
             # Add default profiles
             if "defaults" in context_copy:
-                result["effective_config"]["defaults"] = context_copy["defaults"]
+                result["effective_config"]["defaults"] = dict(context_copy["defaults"])
                 
             # Add available profiles (just the names)
             if "profiles" in context_copy:
@@ -799,17 +946,31 @@ class AdvancedRTSettings:
         return result
     
     @staticmethod
-    def _deep_merge(dict1: Dict[str, Any], dict2: Dict[str, Any]) -> Dict[str, Any]:
-        """Deep merge two dictionaries."""
-        result = dict1.copy()
+    def _deep_merge(base: Dict[str, Any], overlay: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Deep merge ``overlay`` into ``base`` in place and return ``base``.
         
-        for key, value in dict2.items():
-            if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-                result[key] = AdvancedRTSettings._deep_merge(result[key], value)
-            else:
-                result[key] = value
-                
-        return result
+        Nested dictionaries from ``overlay`` are copied into ``base`` rather than
+        shared, so later merges into the result never modify ``overlay``.
+        Callers that need ``base`` unchanged must pass a copy.
+        """
+        # Nothing to merge, e.g. an absent or empty local configuration
+        if not overlay:
+            return base
+        
+        stack = [(base, overlay)]
+        while stack:
+            target, source = stack.pop()
+            for key, value in source.items():
+                if isinstance(value, dict):
+                    existing = target.get(key)
+                    if not isinstance(existing, dict):
+                        existing = target[key] = {}
+                    stack.append((existing, value))
+                else:
+                    target[key] = value
+        
+        return base
 
 def get_parameter_value(param_name: str, default: Any = None) -> Any:
     """
@@ -824,11 +985,11 @@ def get_parameter_value(param_name: str, default: Any = None) -> Any:
     Returns:
         Parameter value from the most appropriate source
     """
-    from .context import ContextManager
+    from .context import get_context
     
     try:
         # Get context instance
-        ctx = ContextManager.get_instance()
+        ctx = get_context()
         
         # Get parameter value using advanced settings
         return ctx.settings.get_param_value(param_name, default)
@@ -1,8 +1,63 @@
 # cli_base/utils/command_registry.py
+import sys
 import click
-from typing import Dict, List, Optional, Any, Callable, Set, Union
+from types import MappingProxyType
+from typing import Dict, List, Optional, Any, Callable, Set, Union, Mapping
 import inspect
 
+# Returned by get_schema_for for unknown commands; read-only so it can be shared
+_EMPTY_SCHEMA: Mapping[str, Any] = MappingProxyType({})
+
+# Extracted schemas keyed by (id(command), command name, number of subcommands).
+# Each entry keeps the command itself, so a reused id() is never mistaken for a hit.
+_SCHEMA_CACHE: Dict[tuple, tuple] = {}
+
+# Formatted type hints keyed by id() of the Click parameter type, stored with
+# the type itself; shared types such as click.INT make hits the common case
+_TYPE_HINT_CACHE: Dict[int, tuple] = {}
+
+def _type_hint(param_type: Any) -> str:
+    """Format the ``<TYPE>`` hint shown next to an option in the schema."""
+    cached = _TYPE_HINT_CACHE.get(id(param_type))
+    if cached is not None and cached[0] is param_type:
+        return cached[1]
+    
+    name = getattr(param_type, 'name', None)
+    if name is None:
+        name = param_type.__name__
+    type_hint = f"<{name.upper()}>"
+    
+    _TYPE_HINT_CACHE[id(param_type)] = (param_type, type_hint)
+    return type_hint
+
+def _extract_options(params: List[click.Parameter]) -> Dict[str, str]:
+    """
+    Build the options section of a schema from a command's parameters.
+    
+    Args:
+        params: The parameters of a Click command
+        
+    Returns:
+        Mapping of formatted option names (with type hint) to help text
+    """
+    options_schema = {}
+    
+    # Single pass over the parameters; arguments have no place in the schema
+    for param in params:
+        # Format option name
+        names = param.opts if isinstance(param, click.Option) else None
+        if names:
+            name = names[0]  # Use the first option name (usually the long form)
+            # Add type hint for display
+            type_hint = _type_hint(param.type) if param.type else ""
+            
+            # Add formatted option to schema; names and help texts repeat
+            # across commands, so interning keeps one copy of each
+            option_name = f"{name} {type_hint}" if type_hint else name
+            options_schema[sys.intern(option_name)] = sys.intern(param.help or "")
+    
+    return options_schema
+
 class CommandRegistry:
     """
     Registry for tracking CLI commands and their schema information.
@@ -15,10 +70,12 @@ class CommandRegistry:
     
     @classmethod
     def get_instance(cls) -> 'CommandRegistry':
-        """Get the singleton instance of the registry."""
-        if cls._instance is None:
-            cls._instance = cls()
-        return cls._instance
+        """
+        Get the singleton instance of the registry.
+        
+        Kept for backward compatibility; new code should call get_registry().
+        """
+        return get_registry()
     
     def __init__(self):
         """Initialize the command registry."""
@@ -55,6 +112,9 @@ class CommandRegistry:
         """
         Get schema information for a command or all commands.
         
+        Prefer get_schema_for() and get_all_schemas(), which do not wrap the
+        result in a new dictionary.
+        
         Args:
             name: Command name to get schema for, or None for all schemas
             
@@ -65,6 +125,23 @@ class CommandRegistry:
             return {name: self._schemas.get(name, {})}
         return self._schemas
     
+    def get_schema_for(self, name: str) -> Mapping[str, Any]:
+        """
+        Get the schema of a single command.
+        
+        Args:
+            name: Command name to get schema for
+            
+        Returns:
+            Schema dictionary for the command (a shared read-only empty
+            mapping if the command is not registered)
+        """
+        return self._schemas.get(name, _EMPTY_SCHEMA)
+    
+    def get_all_schemas(self) -> Dict[str, Any]:
+        """Get the schemas of all registered commands, keyed by command name."""
+        return self._schemas
+    
     def extract_schema_from_command(self, command_name: str, command: Union[click.Group, click.Command]) -> Dict[str, Any]:
         """
         Extract schema information from a command or command group.
@@ -78,6 +155,12 @@ class CommandRegistry:
         Returns:
             Schema dictionary for the command
         """
+        # Reuse the schema if this command was already extracted in this process
+        cache_key = (id(command), command_name, len(getattr(command, 'commands', ())))
+        cached = _SCHEMA_CACHE.get(cache_key)
+        if cached is not None and cached[0] is command:
+            return cached[1]
+        
         # Get help text from command docstring
         help_text = command.help or f"Manage {command_name}"
         
@@ -88,63 +171,25 @@ class CommandRegistry:
         }
         
         # Check if this is a command group or a simple command
-        if isinstance(command, click.Group) and hasattr(command, 'commands'):
+        if isinstance(command, click.Group):
             # Extract subcommands
             for subcmd_name, subcmd in command.commands.items():
                 # Get subcommand help text
                 subcmd_help = subcmd.help or f"{subcmd_name.capitalize()} {command_name}"
                 
-                # Initialize subcommand schema
+                # Initialize subcommand schema with its options
                 subcmd_schema = {
                     "help": subcmd_help,
-                    "options": {}
+                    "options": _extract_options(subcmd.params)
                 }
                 
-                # Extract parameters
-                for param in subcmd.params:
-                    if isinstance(param, click.Option):
-                        # Format option name
-                        names = param.opts
-                        if names:
-                            name = names[0]  # Use the first option name (usually the long form)
-                            # Add type hint for display
-                            type_hint = ""
-                            if param.type:
-                                if hasattr(param.type, 'name'):
-                                    type_hint = f"<{param.type.name.upper()}>"
-                                else:
-                                    type_hint = f"<{param.type.__name__.upper()}>"
-                            
-                            # Add formatted option to schema
-                            option_name = f"{name} {type_hint}" if type_hint else name
-                            subcmd_schema["options"][option_name] = param.help or ""
-                
                 # Add subcommand to schema
                 schema["subcommands"][subcmd_name] = subcmd_schema
         else:
             # For simple commands, add options directly to the main schema
-            options_schema = {}
-            for param in command.params:
-                if isinstance(param, click.Option):
-                    # Format option name
-                    names = param.opts
-                    if names:
-                        name = names[0]  # Use the first option name (usually the long form)
-                        # Add type hint for display
-                        type_hint = ""
-                        if param.type:
-                            if hasattr(param.type, 'name'):
-                                type_hint = f"<{param.type.name.upper()}>"
-                            else:
-                                type_hint = f"<{param.type.__name__.upper()}>"
-                        
-                        # Add formatted option to schema
-                        option_name = f"{name} {type_hint}" if type_hint else name
-                        options_schema[option_name] = param.help or ""
-            
-            # Add options to the main schema
-            schema["options"] = options_schema
+            schema["options"] = _extract_options(command.params)
         
+        _SCHEMA_CACHE[cache_key] = (command, schema)
         return schema
     
     def register_commands_from_cli(self, cli: click.Group) -> None:
@@ -157,8 +202,25 @@ class CommandRegistry:
         Args:
             cli: The main Click CLI group
         """
-        for cmd_name, cmd in cli.commands.items():
-            # Extract schema for both groups and simple commands
-            schema = self.extract_schema_from_command(cmd_name, cmd)
-            # Register command or command group
-            self.register_command(cmd_name, cmd, schema)
\ No newline at end of file
+        commands = cli.commands
+        
+        # Register all commands and command groups in one update each,
+        # extracting the schema for both groups and simple commands
+        self._commands.update(commands)
+        self._schemas.update(
+            (cmd_name, self.extract_schema_from_command(cmd_name, cmd))
+            for cmd_name, cmd in commands.items()
+        )
+
+
+# The registry instance, read directly by get_registry()
+_REGISTRY: Optional[CommandRegistry] = None
+
+
+def get_registry() -> CommandRegistry:
+    """Get the command registry, creating it on first use."""
+    global _REGISTRY
+    registry = _REGISTRY
+    if registry is None:
+        registry = _REGISTRY = CommandRegistry._instance = CommandRegistry()
+    return registry
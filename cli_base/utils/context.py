@@ -3,7 +3,11 @@ Context management utilities for CLI tool.
 Provides access to runtime settings throughout the CLI.
 """
 
-from typing import Optional, Dict, Any, TYPE_CHECKING
+import os
+import sys
+import click
+from pathlib import Path
+from typing import Optional, Dict, Any, Tuple, TYPE_CHECKING
 
 # Import only types to avoid circular imports
 if TYPE_CHECKING:
@@ -19,6 +23,9 @@ class ContextManager:
     """
     _instance = None
     _settings = None
+    # Inputs the current settings were built from (see _settings_inputs);
+    # None when unknown, e.g. after a direct initialize()
+    _settings_key = None
 
     def __new__(cls):
         if cls._instance is None:
@@ -44,9 +51,11 @@ class ContextManager:
         if cli_args is None:
             cli_args = {}
             
+        global _CTX
         instance = cls()
         instance._settings = AdvancedRTSettings(cli_args, resolver)
-        cls._instance = instance
+        instance._settings_key = None
+        cls._instance = _CTX = instance
         return instance
 
     @classmethod
@@ -57,13 +66,9 @@ class ContextManager:
         Returns:
             The singleton context manager instance
         
-        Raises:
-            RuntimeError: If the context manager has not been initialized
+        Kept for backward compatibility; new code should call get_context().
         """
-        if cls._instance is None:
-            # Auto-initialize with default settings rather than raising an error
-            return cls.initialize({"scope": "local"})
-        return cls._instance
+        return get_context()
 
     @property
     def settings(self) -> 'AdvancedRTSettings':
@@ -80,6 +85,52 @@ class ContextManager:
             raise RuntimeError("Runtime settings not initialized.")
         return self._settings
 
+def _file_stamp(path: Path) -> Optional[Tuple[int, int]]:
+    """Modification time and size of a file, or None if it cannot be read."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _settings_inputs(cli_args: Dict[str, Any], resolver: Optional['ParameterResolver']) -> Tuple:
+    """
+    Describe everything AdvancedRTSettings is built from: the arguments, the
+    resolver, the command line, the Click command being run (whose context
+    and command configuration the settings carry), the configuration file
+    locations (located the same way AdvancedRTSettings does) and the state
+    of those files themselves.
+    """
+    from .advanced_settings import _config_file_paths, _scan_scope_flags
+    from .param_resolver import get_command_path
+    
+    click_ctx = click.get_current_context(silent=True)
+    command_path = get_command_path(click_ctx) if click_ctx is not None else None
+    argv = list(sys.argv)
+    paths = _config_file_paths(cli_args, _scan_scope_flags(argv))
+    return (
+        dict(cli_args), resolver, argv, command_path, paths,
+        tuple(_file_stamp(path) if path else None for path in paths),
+    )
+
+# The initialized context manager, read directly by get_context()
+_CTX: Optional[ContextManager] = None
+
+
+def get_context() -> ContextManager:
+    """
+    Get the context manager, initializing it with default settings
+    (local scope) if that has not happened yet.
+    
+    Returns:
+        The singleton context manager instance
+    """
+    ctx = _CTX
+    if ctx is None:
+        return ContextManager.initialize({"scope": "local"})
+    return ctx
+
 # Main initialization function for the context manager with advanced settings
 def initialize_context(cli_args: Optional[Dict[str, Any]] = None,
                       resolver: Optional['ParameterResolver'] = None) -> ContextManager:
@@ -100,29 +151,22 @@ def initialize_context(cli_args: Optional[Dict[str, Any]] = None,
     if cli_args is None:
         cli_args = {}
     
-    try:
-        # Try to get existing context manager
-        ctx = ContextManager.get_instance()
-        
-        # Update with new args if provided
-        if cli_args:
-            from .advanced_settings import AdvancedRTSettings
-            ctx._settings = AdvancedRTSettings(cli_args, resolver)
-        
+    # No context manager yet: create one directly with these arguments
+    ctx = _CTX
+    if ctx is None or ctx._settings is None:
+        cli_args = cli_args or {"scope": "local"}
+        key = _settings_inputs(cli_args, resolver)
+        ctx = ContextManager.initialize(cli_args, resolver)
+        ctx._settings_key = key
         return ctx
-    except RuntimeError:
-        # No context manager exists, initialize one
-        try:
-            return ContextManager.initialize(cli_args, resolver)
-        except Exception as e:
-            # In case of error during initialization, provide fallback behavior
-            from .formatting import OutputFormatter
-            OutputFormatter.print_error(f"Warning: Error initializing context: {str(e)}")
-            
-            # Create a basic instance
+    
+    # Update with new args if provided, unless the current settings were
+    # built from exactly the same inputs
+    if cli_args:
+        key = _settings_inputs(cli_args, resolver)
+        if key != ctx._settings_key:
             from .advanced_settings import AdvancedRTSettings
-            instance = ContextManager()
-            instance._settings = AdvancedRTSettings(cli_args, resolver)
-            ContextManager._instance = instance
-            return instance
-
+            ctx._settings = AdvancedRTSettings(cli_args, resolver)
+            ctx._settings_key = key
+    
+    return ctx
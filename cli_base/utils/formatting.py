@@ -3,19 +3,21 @@ Formatting utilities for CLI tool output.
 Provides colorful and structured terminal output.
 """
 
-from rich.console import Console
-from rich.table import Table
-from rich.tree import Tree
-from rich.panel import Panel
-from rich.text import Text
-from rich.style import Style
-from rich.syntax import Syntax
-from rich.theme import Theme
-from rich import box
-from typing import Dict, List, Any, Optional, Union
+import importlib
+import sys
+from typing import Dict, List, Any, Optional, Set, Tuple, Union, TYPE_CHECKING
 
-# Define a custom theme for the CLI
-cli_theme = Theme({
+# rich is imported on first use rather than at module load, which keeps
+# it off the startup path of commands that print little or nothing
+if TYPE_CHECKING:
+    from pygments.lexer import Lexer
+    from rich import box
+    from rich.console import Console
+    from rich.syntax import SyntaxTheme
+    from rich.theme import Theme
+
+# Styles of the custom CLI theme
+CLI_THEME_STYLES = {
     "command": "bright_cyan",
     "subcommand": "blue",
     "option": "green",
@@ -30,9 +32,136 @@ cli_theme = Theme({
     "section": "yellow bold",
     "key": "cyan",
     "default": "green italic",
-})
+}
+
+_theme: Optional["Theme"] = None
+_console: Optional["Console"] = None
+
+
+def _get_theme() -> "Theme":
+    """Return the custom CLI theme, creating it on first use."""
+    global _theme
+    if _theme is None:
+        from rich.theme import Theme
+        _theme = Theme(CLI_THEME_STYLES)
+    return _theme
+
+
+def _get_console() -> "Console":
+    """Return the shared themed console, creating it on first use."""
+    global _console
+    if _console is None:
+        from rich.console import Console
+        _console = Console(theme=_get_theme())
+    return _console
+
+
+_json_highlighting: Optional[Tuple["Lexer", "SyntaxTheme"]] = None
+
+
+def _get_json_highlighting() -> Tuple["Lexer", "SyntaxTheme"]:
+    """
+    Return the JSON lexer and monokai theme used by print_json.
+    
+    Both are created on first use and shared afterwards, so repeated JSON
+    output skips the lexer lookup and theme construction, and the theme's
+    token style cache stays warm.
+    """
+    global _json_highlighting
+    if _json_highlighting is None:
+        from pygments.lexers import get_lexer_by_name
+        from rich.syntax import Syntax
+        _json_highlighting = (get_lexer_by_name("json"), Syntax.get_theme("monokai"))
+    return _json_highlighting
+
+
+# Messages already printed by print_error/print_warning with once=True
+_REPORTED_MESSAGES: Set[str] = set()
+
+
+def _already_reported(message: str) -> bool:
+    """Return True if the message was reported before; otherwise record it."""
+    if message in _REPORTED_MESSAGES:
+        return True
+    _REPORTED_MESSAGES.add(message)
+    return False
+
+
+# Names of the sensitive (masked) fields of each profile type seen by print_profile
+_SENSITIVE_FIELDS_CACHE: Dict[type, frozenset] = {}
+
+# Asterisk runs used to mask sensitive values, indexed by length
+_MASKS = tuple("*" * length for length in range(129))
+
+# Style of each print_table column name seen so far
+_COLUMN_STYLE_CACHE: Dict[str, str] = {}
+
+
+def _resolve_column_style(column: str) -> str:
+    """Work out the style of a print_table column and remember it."""
+    # Special styling for specific columns
+    lowered = column.lower()
+    if lowered in ("name", "key", "property"):
+        style = "key"
+    elif lowered == "default":
+        style = "default"
+    elif lowered in ("provider", "model"):
+        style = "highlight"
+    else:
+        style = "white"
+    
+    _COLUMN_STYLE_CACHE[column] = style
+    return style
+
 
-console = Console(theme=cli_theme)
+# Static rows of the CONFIG SCOPE FLAGS and GLOBAL OPTIONS sections of print_command_tree
+_SCOPE_FLAG_LINES = (
+    "[option]--global[/option]            [value]Use global configuration[/value]",
+    "[option]--local[/option]             [value]Use local configuration[/value]",
+    "[option]--file <PATH>[/option]       [value]Use named configuration file[/value]",
+)
+_GLOBAL_OPTION_LINES = (
+    "[option]--help, -h[/option]          [value]Show help message[/value]",
+    "[option]--verbose, -v[/option]       [value]Enable verbose output[/value]",
+    "[option]--quiet, -q[/option]         [value]Suppress non-essential output[/value]",
+)
+
+# rich names that used to be imported eagerly here, as (module, attribute);
+# an attribute of None means the module itself
+_LAZY_RICH_NAMES = {
+    "Console": ("rich.console", "Console"),
+    "Table": ("rich.table", "Table"),
+    "Tree": ("rich.tree", "Tree"),
+    "Panel": ("rich.panel", "Panel"),
+    "Text": ("rich.text", "Text"),
+    "Style": ("rich.style", "Style"),
+    "Syntax": ("rich.syntax", "Syntax"),
+    "Theme": ("rich.theme", "Theme"),
+    "box": ("rich.box", None),
+}
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Resolve lazily loaded module attributes (``console``, ``cli_theme`` and
+    the rich names listed in _LAZY_RICH_NAMES).
+    
+    The resolved value is bound onto the module, so later accesses are plain
+    attribute lookups that no longer reach this function.
+    """
+    if name == "console":
+        value = _get_console()
+    elif name == "cli_theme":
+        value = _get_theme()
+    elif name in _LAZY_RICH_NAMES:
+        module_name, attr_name = _LAZY_RICH_NAMES[name]
+        module = importlib.import_module(module_name)
+        value = getattr(module, attr_name) if attr_name else module
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    setattr(sys.modules[__name__], name, value)
+    return value
 
 class OutputFormatter:
     """Formats CLI output with color and structure."""
@@ -48,42 +177,61 @@ class OutputFormatter:
     @staticmethod
     def print_success(message: str) -> None:
         """Print a success message in green."""
-        console.print(f"[success]{message}[/success]")
+        _get_console().print(f"[success]{message}[/success]")
     
     @staticmethod
-    def print_warning(message: str) -> None:
-        """Print a warning message in yellow."""
-        console.print(f"[warning]{message}[/warning]")
+    def print_warning(message: str, once: bool = False) -> None:
+        """
+        Print a warning message in yellow.
+        
+        Args:
+            message: The message to print
+            once: Print the message only the first time it occurs in this process
+        """
+        if once and _already_reported(message):
+            return
+        _get_console().print(f"[warning]{message}[/warning]")
     
     @staticmethod
-    def print_error(message: str) -> None:
-        """Print an error message in red."""
-        console.print(f"[error]{message}[/error]")
+    def print_error(message: str, once: bool = False) -> None:
+        """
+        Print an error message in red.
+        
+        Args:
+            message: The message to print
+            once: Print the message only the first time it occurs in this process
+        """
+        if once and _already_reported(message):
+            return
+        _get_console().print(f"[error]{message}[/error]")
     
     @staticmethod
     def print_info(message: str) -> None:
         """Print an informational message in blue."""
-        console.print(f"[info]{message}[/info]")
+        _get_console().print(f"[info]{message}[/info]")
         
     @classmethod
     def print_verbose(cls, message: str) -> None:
         """Print a verbose message when verbose mode is enabled."""
         if cls.verbose_mode:
-            console.print(f"[dim]{message}[/dim]")
+            _get_console().print(f"[dim]{message}[/dim]")
     
     @staticmethod
     def print_json(data: Dict[str, Any], title: Optional[str] = None) -> None:
         """Print data as formatted JSON with color highlighting."""
         import json
+        from rich.panel import Panel
+        from rich.syntax import Syntax
         
         # Convert data to a formatted JSON string
         json_str = json.dumps(data, indent=2)
         
-        # Create a syntax highlighted JSON
+        # Create a syntax highlighted JSON, reusing the lexer and theme
+        lexer, theme = _get_json_highlighting()
         syntax = Syntax(
             json_str, 
-            "json", 
-            theme="monokai",
+            lexer, 
+            theme=theme,
             word_wrap=True,
             line_numbers=False,
             indent_guides=True,
@@ -97,22 +245,25 @@ class OutputFormatter:
                 expand=False,
                 padding=(1, 2)
             )
-            console.print(panel)
+            _get_console().print(panel)
         else:
-            console.print(syntax)
+            _get_console().print(syntax)
     
     @staticmethod
     def print_table(
         data: List[Dict[str, Any]], 
         columns: List[str], 
         title: Optional[str] = None,
-        box_style: box.Box = box.ROUNDED
+        box_style: Optional["box.Box"] = None
     ) -> None:
-        """Print data as a colored table."""
+        """Print data as a colored table (rounded box unless box_style is given)."""
+        from rich import box
+        from rich.table import Table
+        
         # Create a table with a border style
         table = Table(
             title=f"[title]{title}[/title]" if title else None,
-            box=box_style, 
+            box=box_style or box.ROUNDED, 
             show_header=True, 
             header_style="header",
             title_style="title",
@@ -121,32 +272,24 @@ class OutputFormatter:
         
         # Add columns with color styles
         for column in columns:
-            # Special styling for specific columns
-            if column.lower() in ["name", "key", "property"]:
-                style = "key"
-            elif column.lower() == "default":
-                style = "default"
-            elif column.lower() in ["provider", "model"]:
-                style = "highlight"
-            else:
-                style = "white"
-            
+            style = _COLUMN_STYLE_CACHE.get(column) or _resolve_column_style(column)
             table.add_column(column, style=style)
         # Add rows with appropriate styling
+        table_add_row = table.add_row
         for row in data:
+            row_get = row.get
             row_values = []
             for col in columns:
-                value = str(row.get(col, ""))
-                #print( f"from row: {row} and col: {col} the value is: {value}")
+                value = str(row_get(col, ""))
                 # Special styling for the "Default" column with a checkmark
                 if col == "Default" and value == "✓":
                     value = f"[default]{value}[/default]"
                 
                 row_values.append(value)
             
-            table.add_row(*row_values)
+            table_add_row(*row_values)
         
-        console.print(table)
+        _get_console().print(table)
     
     @staticmethod
     def print_tree(
@@ -155,13 +298,19 @@ class OutputFormatter:
         show_values: bool = True
     ) -> None:
         """Print a hierarchical tree structure with color coding."""
+        from rich.tree import Tree
+        
         tree = Tree(f"[command]{title}[/command]", guide_style="blue")
         
-        def add_nodes(parent, data):
+        # Walk the data with an explicit stack of (tree node, dict) pairs; each
+        # node gets all of its children at once, so the output order is kept
+        stack = [(tree, tree_data)]
+        while stack:
+            parent, data = stack.pop()
             for key, value in data.items():
                 if isinstance(value, dict):
                     node = parent.add(f"[key]{key}[/key]")
-                    add_nodes(node, value)
+                    stack.append((node, value))
                 elif isinstance(value, list):
                     node = parent.add(f"[section]{key}[/section]")
                     for item in value:
@@ -175,51 +324,55 @@ class OutputFormatter:
                 elif show_values:
                     parent.add(f"[key]{key}:[/key] [value]{value}[/value]")
         
-        add_nodes(tree, tree_data)
-        console.print(tree)
+        _get_console().print(tree)
     
     @staticmethod
     def print_command_tree(commands: Dict[str, Any]) -> None:
         """Print a formatted command tree structure with vibrant colors."""
-        tree = Tree(f"[command]cli_base[/command]", guide_style="blue")
+        from rich.tree import Tree
+        
+        tree = Tree("[command]cli_base[/command]", guide_style="blue")
         
         # Commands section
-        cmd_section = tree.add(f"[section]COMMANDS[/section]")
+        cmd_section = tree.add("[section]COMMANDS[/section]")
         for cmd_name, cmd_info in commands.items():
+            cmd_help = cmd_info.get('help', '')
             cmd_node = cmd_section.add(
-                f"[command]{cmd_name}[/command]                [value]{cmd_info.get('help', '')}[/value]"
+                f"[command]{cmd_name}[/command]                [value]{cmd_help}[/value]"
             )
             
             # Add subcommands if any
-            if "subcommands" in cmd_info and cmd_info["subcommands"]:
-                for subcmd_name, subcmd_info in cmd_info["subcommands"].items():
+            subcommands = cmd_info.get("subcommands")
+            if subcommands:
+                for subcmd_name, subcmd_info in subcommands.items():
+                    subcmd_help = subcmd_info.get('help', '')
                     subcmd_node = cmd_node.add(
-                        f"[subcommand]{subcmd_name}[/subcommand]            [value]{subcmd_info.get('help', '')}[/value]"
+                        f"[subcommand]{subcmd_name}[/subcommand]            [value]{subcmd_help}[/value]"
                     )
                     
                     # Add options if any
-                    if "options" in subcmd_info:
-                        for opt_name, opt_help in subcmd_info["options"].items():
+                    subcmd_options = subcmd_info.get("options")
+                    if subcmd_options is not None:
+                        for opt_name, opt_help in subcmd_options.items():
                             subcmd_node.add(f"[option]{opt_name}[/option] [value]{opt_help}[/value]")
             
             # Add options for simple commands
-            if "options" in cmd_info:
-                for opt_name, opt_help in cmd_info["options"].items():
+            cmd_options = cmd_info.get("options")
+            if cmd_options is not None:
+                for opt_name, opt_help in cmd_options.items():
                     cmd_node.add(f"[option]{opt_name}[/option] [value]{opt_help}[/value]")
         
         # Config scope flags section
-        flags_section = tree.add(f"[section]CONFIG SCOPE FLAGS[/section]")
-        flags_section.add("[option]--global[/option]            [value]Use global configuration[/value]")
-        flags_section.add("[option]--local[/option]             [value]Use local configuration[/value]")
-        flags_section.add("[option]--file <PATH>[/option]       [value]Use named configuration file[/value]")
+        flags_section = tree.add("[section]CONFIG SCOPE FLAGS[/section]")
+        for line in _SCOPE_FLAG_LINES:
+            flags_section.add(line)
         
         # Global options section
-        options_section = tree.add(f"[section]GLOBAL OPTIONS[/section]")
-        options_section.add("[option]--help, -h[/option]          [value]Show help message[/value]")
-        options_section.add("[option]--verbose, -v[/option]       [value]Enable verbose output[/value]")
-        options_section.add("[option]--quiet, -q[/option]         [value]Suppress non-essential output[/value]")
+        options_section = tree.add("[section]GLOBAL OPTIONS[/section]")
+        for line in _GLOBAL_OPTION_LINES:
+            options_section.add(line)
         
-        console.print(tree)
+        _get_console().print(tree)
     
     @classmethod
     def print_runtime_settings(cls, include_configs: bool = False):
@@ -235,7 +388,6 @@ class OutputFormatter:
         try:
             # This import is inside the function to avoid circular imports
             # We need to use absolute import to make sure it works in all contexts
-            import importlib
             context_module = importlib.import_module('cli_base.utils.context') 
             ContextManager = context_module.ContextManager
             
@@ -252,15 +404,13 @@ class OutputFormatter:
             )
             
             # Print the JSON with a title and double box for emphasis
-            from rich import box
             cls.print_json(status_json, "Runtime Settings (Verbose Mode)")
         except Exception as e:
-            cls.print_warning(f"Could not display runtime settings: {str(e)}")
+            cls.print_warning(f"Could not display runtime settings: {str(e)}", once=True)
             
     @classmethod
     def detect_verbose_mode(cls):
         """Detect verbose mode from command line arguments and set it."""
-        import sys
         verbose = "-v" in sys.argv or "--verbose" in sys.argv
         cls.set_verbose(verbose)
         return verbose
@@ -273,7 +423,6 @@ class OutputFormatter:
             
         cls.print_info(f"Verbose mode detected: {cls.verbose_mode}")
         
-        import sys
         cls.print_info(f"System arguments: {sys.argv}")
         cls.print_info(f"Command: {command_name}")
         
@@ -289,7 +438,6 @@ class OutputFormatter:
             
         try:
             # Get the context and settings
-            import importlib
             context_module = importlib.import_module('cli_base.utils.context') 
             ContextManager = context_module.ContextManager
             
@@ -300,12 +448,12 @@ class OutputFormatter:
             status_json = rt.to_json(include_configs=include_configs)
             
             # Print a divider
-            console.print("\n" + "=" * 80 + "\n", style="blue")
+            _get_console().print("\n" + "=" * 80 + "\n", style="blue")
             
             # Print the JSON with a title
             cls.print_json(status_json, "Runtime Settings (Verbose Mode)")
         except Exception as e:
-            cls.print_warning(f"Could not display runtime settings: {str(e)}")
+            cls.print_warning(f"Could not display runtime settings: {str(e)}", once=True)
     
     @staticmethod
     def print_profile(profile: Dict[str, Any], name: str, profile_type: str = "LLM") -> None:
@@ -317,26 +465,29 @@ class OutputFormatter:
             name: The name of the profile
             profile_type: The type of profile (default: "LLM")
         """
+        from rich import box
+        from rich.table import Table
+        from rich.text import Text
+        
         title = Text()
         title.append(f"{profile_type} Profile: ", style="title")
         title.append(name, style="highlight")
         
-        console.print(title)
+        _get_console().print(title)
         
         # Create a table for profile details
         table = Table(box=box.ROUNDED, show_header=True, header_style="header", border_style="blue")
         table.add_column("Property", style="key")
         table.add_column("Value", style="value")
         
-        # Get sensitive field info
-        sensitive_fields = []
-        for key, param in [(p["name"], p) for p in getattr(profile, "_params", [])]:
-            if param.get("sensitive", False):
-                sensitive_fields.append(key)
-        
-        # Always consider api_key as sensitive
-        if "api_key" not in sensitive_fields:
-            sensitive_fields.append("api_key")
+        # Get sensitive field info, computed once per profile type
+        sensitive_fields = _SENSITIVE_FIELDS_CACHE.get(type(profile))
+        if sensitive_fields is None:
+            # Always consider api_key as sensitive
+            sensitive_fields = frozenset({"api_key"}.union(
+                param["name"] for param in getattr(profile, "_params", ()) if param.get("sensitive", False)
+            ))
+            _SENSITIVE_FIELDS_CACHE[type(profile)] = sensitive_fields
         
         # Special formatting for different property types
         for key, value in profile.items():
@@ -349,7 +500,9 @@ class OutputFormatter:
             if key in sensitive_fields and value:
                 # Keep first 4 and last 4 chars, mask the rest with asterisks
                 if len(value_str) > 8:
-                    value_str = value_str[:4] + "*" * (len(value_str) - 8) + value_str[-4:]
+                    mask_len = len(value_str) - 8
+                    mask = _MASKS[mask_len] if mask_len < len(_MASKS) else "*" * mask_len
+                    value_str = "".join((value_str[:4], mask, value_str[-4:]))
                 else:
                     value_str = "********"  # For very short values
                 value_style = "warning"
@@ -364,11 +517,11 @@ class OutputFormatter:
                 value_style = "command"
             elif key == "max_tokens":
                 value_style = "highlight"
-            elif key in ["region", "project_id", "organization"]:
+            elif key in ("region", "project_id", "organization"):
                 value_style = "command"
             else:
                 value_style = "value"
             
             table.add_row(key, f"[{value_style}]{value_str}[/{value_style}]")
         
-        console.print(table)
\ No newline at end of file
+        _get_console().print(table)
\ No newline at end of file
@@ -5,13 +5,19 @@ Handles the retrieval and preparation of all parameters needed for command execu
 
 import click
 from typing import Any, Dict, Optional, List, Callable, TypeVar, Union, Set
-import inspect
 import functools
-from .context import ContextManager, initialize_context
+import weakref
+from .context import get_context, initialize_context
 
 # Type variable for the command function
 CommandFunc = TypeVar('CommandFunc', bound=Callable)
 
+# Parameter name -> parameter maps per command; weak keys so that commands
+# which are discarded are not kept alive by the cache
+_PARAM_MAP_CACHE: "weakref.WeakKeyDictionary[click.Command, Dict[str, click.Parameter]]" = weakref.WeakKeyDictionary()
+# Non-None parameter defaults per command, keyed the same way
+_PARAM_DEFAULTS_CACHE: "weakref.WeakKeyDictionary[click.Command, Dict[str, Any]]" = weakref.WeakKeyDictionary()
+
 class ParameterResolver:
     """
     Handles the resolution of parameters for CLI commands.
@@ -21,9 +27,8 @@ class ParameterResolver:
     before the actual command execution.
     """
     
-    def __init__(self):
-        """Initialize a parameter resolver."""
-        self._param_cache = {}
+    # Command path prefixes whose "profile" parameter defaults to the LLM profile
+    _LLM_COMMAND_PREFIXES = ("generate", "llm")
     
     def resolve_command_params(self, ctx: click.Context) -> Dict[str, Any]:
         """
@@ -47,8 +52,9 @@ class ParameterResolver:
         # Store the original Click context
         original_click_context = ctx
         
-        # Initialize parameters with the ones already in the context
-        params = dict(ctx.params)
+        # Initialize parameters with the ones already in the context; the copy
+        # keeps ctx.params itself unchanged
+        params = ctx.params.copy()
         
         # Process configuration scope options first
         scope_params = self._extract_scope_params(params)
@@ -57,7 +63,7 @@ class ParameterResolver:
         initialize_context(scope_params)
         
         # Get the settings from the context
-        rt_settings = ContextManager.get_instance().settings
+        rt_settings = get_context().settings
             
         effective_config = rt_settings.get_effective_config()
         
@@ -66,20 +72,17 @@ class ParameterResolver:
         command_path = self._get_command_path(original_click_context)
         config_params = self._get_config_params_for_command(effective_config, command_path)
         
-        # Merge parameters with configuration values for missing parameters
-        for param_name, param_obj in self._get_command_params(command).items():
-            # Skip if parameter is already resolved through CLI
-            if param_name in params and params[param_name] is not None:
-                continue
-                
-            # Try to get from configuration
-            if param_name in config_params and config_params[param_name] is not None:
-                params[param_name] = config_params[param_name]
-                continue
-                
-            # Use default value if none provided
-            if param_obj.default is not None and param_obj.default != click.types.UnprocessedParamType():
-                params[param_name] = param_obj.default
+        # Parameters not given on the CLI fall back to configuration values,
+        # then to the command's defaults; both merged into one dict up front
+        fallback = {
+            **self._get_command_defaults(command),
+            **{name: value for name, value in config_params.items() if value is not None},
+        }
+        for param_name in self._get_command_params(command):
+            if params.get(param_name) is None:
+                value = fallback.get(param_name)
+                if value is not None:
+                    params[param_name] = value
         
         # Process any special parameters (like profiles) that need additional resolution
         params = self._resolve_special_parameters(params, effective_config, command_path)
@@ -129,21 +132,7 @@ class ParameterResolver:
         if not isinstance(ctx, click.Context):
             return ""  # Return empty path if not a proper Click context
             
-        command_path = []
-        current = ctx
-        
-        # Walk up the context hierarchy to build the full command path
-        while current is not None and isinstance(current, click.Context):
-            if hasattr(current, 'info_name') and current.info_name and current.info_name != 'cli':  # Skip the main CLI
-                command_path.insert(0, current.info_name)
-            
-            # Safety check for parent attribute
-            if not hasattr(current, 'parent'):
-                break
-                
-            current = current.parent
-            
-        return ".".join(command_path)
+        return get_command_path(ctx)
     
     def _get_command_params(self, command: Union[click.Command, click.Group]) -> Dict[str, click.Parameter]:
         """
@@ -155,7 +144,33 @@ class ParameterResolver:
         Returns:
             Dictionary mapping parameter names to parameter objects
         """
-        return {param.name: param for param in command.params}
+        # A command's parameters do not change once it is defined
+        param_map = _PARAM_MAP_CACHE.get(command)
+        if param_map is None:
+            param_map = {param.name: param for param in command.params}
+            _PARAM_MAP_CACHE[command] = param_map
+        return param_map
+    
+    def _get_command_defaults(self, command: Union[click.Command, click.Group]) -> Dict[str, Any]:
+        """
+        Get the default values defined for a command's parameters.
+        
+        Args:
+            command: Click command or group object
+            
+        Returns:
+            Dictionary mapping parameter names to their defaults, for
+            parameters whose default is not None
+        """
+        defaults = _PARAM_DEFAULTS_CACHE.get(command)
+        if defaults is None:
+            defaults = {
+                name: param.default
+                for name, param in self._get_command_params(command).items()
+                if param.default is not None
+            }
+            _PARAM_DEFAULTS_CACHE[command] = defaults
+        return defaults
     
     def _get_config_params_for_command(self, config: Dict[str, Any], command_path: str) -> Dict[str, Any]:
         """
@@ -190,12 +205,14 @@ class ParameterResolver:
         """
         # Handle profile parameters if present
         # For example, if a parameter is named "profile" and refers to a profile type
-        if "profile" in params and params["profile"] is None:
-            # For LLM commands, try to resolve the profile
-            if command_path.startswith("generate") or command_path.startswith("llm"):
-                default_profile = self._get_default_profile("llm", config)
-                if default_profile:
-                    params["profile"] = default_profile
+        if "profile" not in params or params["profile"] is not None:
+            return params
+        
+        # For LLM commands, try to resolve the profile
+        if command_path.startswith(self._LLM_COMMAND_PREFIXES):
+            default_profile = self._get_default_profile("llm", config)
+            if default_profile:
+                params["profile"] = default_profile
         
         return params
     
@@ -214,6 +231,10 @@ class ParameterResolver:
             return config["defaults"][profile_type]
         return None
 
+# Shared resolver used by with_resolved_params and resolve_params; it keeps no
+# per-command state, so one instance serves every call
+_RESOLVER = ParameterResolver()
+
 # Create a decorator that applies parameter resolution to a command
 def with_resolved_params(func: CommandFunc) -> CommandFunc:
     """
@@ -234,8 +255,7 @@ def with_resolved_params(func: CommandFunc) -> CommandFunc:
         ctx = click.get_current_context()
         
         # Resolve parameters
-        resolver = ParameterResolver()
-        resolved_params = resolver.resolve_command_params(ctx)
+        resolved_params = _RESOLVER.resolve_command_params(ctx)
         
         # Update kwargs with resolved parameters
         for name, value in resolved_params.items():
@@ -263,5 +283,43 @@ def resolve_params(ctx: Optional[click.Context] = None) -> Dict[str, Any]:
     if ctx is None:
         ctx = click.get_current_context()
         
-    resolver = ParameterResolver()
-    return resolver.resolve_command_params(ctx)
\ No newline at end of file
+    return _RESOLVER.resolve_command_params(ctx)
+
+
+def get_command_path(ctx: Optional[click.Context] = None) -> str:
+    """
+    Get the dotted command path (e.g., "generate.prompt") for a command.
+    
+    The path is computed once per Click context and shared by parameter
+    resolution and the runtime settings, so logging or other code can call
+    this freely.
+    
+    Args:
+        ctx: Click context (if None, the current context will be used)
+        
+    Returns:
+        The command path, as used for command-specific configuration keys
+    """
+    if ctx is None:
+        ctx = click.get_current_context()
+        
+    # Computed once per context and remembered on it
+    cached = getattr(ctx, "_cli_base_command_path", None)
+    if cached is not None:
+        return cached
+    
+    command_path = []
+    current = ctx
+    
+    # Walk up the context hierarchy to build the full command path,
+    # innermost command first, then reverse once
+    while current is not None and isinstance(current, click.Context):
+        name = current.info_name
+        if name and name != 'cli':  # Skip the main CLI
+            command_path.append(name)
+        current = current.parent
+    command_path.reverse()
+    
+    path = ".".join(command_path)
+    ctx._cli_base_command_path = path
+    return path
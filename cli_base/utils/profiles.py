@@ -5,7 +5,7 @@ Handles different types of profiles like LLM, database, etc.
 
 import json
 from typing import Dict, Any, List, Optional, TypedDict
-from .context import ContextManager
+from .context import get_context
 
 
 class ProfileManager:
@@ -27,7 +27,7 @@ class ProfileManager:
             raise ValueError("Profile must have a name")
         
         # Get runtime settings
-        rt = ContextManager.get_instance().settings
+        rt = get_context().settings
         
         # Create profile in configuration
         rt.create_profile(self.profile_type, profile_data, scope)
@@ -35,7 +35,7 @@ class ProfileManager:
     
     def list_profiles(self, scope: str) -> Dict[str, Dict[str, Any]]:
         """List all profiles of a specific type."""
-        rt = ContextManager.get_instance().settings
+        rt = get_context().settings
         return rt.get_profiles(self.profile_type, scope)
     
     def get_profile(self, name: str) -> Dict[str, Any]:
@@ -45,12 +45,12 @@ class ProfileManager:
         This method will check all available scopes for a profile with the given name,
         following the precedence rules defined for configuration loading.
         """
-        rt = ContextManager.get_instance().settings
+        rt = get_context().settings
         return rt.get_profile_from_any_scope(self.profile_type, name)
     
     def get_profile_from_scope(self, name: str, scope: str) -> Dict[str, Any]:
         """Get a specific profile from a specific scope."""
-        rt = ContextManager.get_instance().settings
+        rt = get_context().settings
         profiles = rt.get_profiles(self.profile_type, scope)
         
         if name not in profiles:
@@ -60,17 +60,17 @@ class ProfileManager:
     
     def edit_profile(self, name: str, updates: Dict[str, Any], scope: str) -> Dict[str, Any]:
         """Edit an existing profile."""
-        rt = ContextManager.get_instance().settings
+        rt = get_context().settings
         return rt.edit_profile(self.profile_type, name, updates, scope)
     
     def delete_profile(self, name: str, scope: str) -> None:
         """Delete a profile."""
-        rt = ContextManager.get_instance().settings
+        rt = get_context().settings
         rt.delete_profile(self.profile_type, name, scope)
     
     def use_profile(self, name: str, scope: str) -> None:
         """Set a profile as the default for its type."""
-        rt = ContextManager.get_instance().settings
+        rt = get_context().settings
         rt.set_default_profile(self.profile_type, name, scope)
     
     def get_default_profile(self) -> Optional[str]:
@@ -80,7 +80,7 @@ class ProfileManager:
         This method will check all available scopes for a default profile,
         following the precedence rules defined for configuration loading.
         """
-        rt = ContextManager.get_instance().settings
+        rt = get_context().settings
         return rt.get_default_profile_from_any_scope(self.profile_type)
     
     def parse_profile_input(self, input_str: str) -> Dict[str, Any]:
@@ -0,0 +1,66 @@
+"""
+Tests for runtime settings reuse in the context manager.
+"""
+
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import click
+from click.testing import CliRunner
+
+from cli_base.utils import context
+from cli_base.utils.context import ContextManager, initialize_context
+
+
+class InitializeContextTest(unittest.TestCase):
+    """Settings reuse across several commands run in one process."""
+
+    def setUp(self):
+        # Isolated home and working directories for the configuration files
+        home = tempfile.TemporaryDirectory()
+        work = tempfile.TemporaryDirectory()
+        self.addCleanup(home.cleanup)
+        self.addCleanup(work.cleanup)
+
+        env = mock.patch.dict(os.environ, {"HOME": home.name})
+        env.start()
+        self.addCleanup(env.stop)
+
+        cwd = os.getcwd()
+        os.chdir(work.name)
+        self.addCleanup(os.chdir, cwd)
+
+        # Start without a context manager and restore the previous one afterwards
+        for owner, name in ((context, "_CTX"), (ContextManager, "_instance")):
+            patcher = mock.patch.object(owner, name, None)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        os.makedirs(".cli-tool")
+        with open(os.path.join(".cli-tool", "config.json"), "w") as f:
+            json.dump({"commands": {"alpha": {"color": "red"}, "beta": {"color": "blue"}}}, f)
+
+    def test_different_commands_get_their_own_settings(self):
+        @click.group()
+        def cli():
+            pass
+
+        def add_command(name):
+            @cli.command(name=name)
+            def command():
+                settings = initialize_context({"scope": "local", "file_path": None}).settings
+                click.echo(f"{settings.command_context['command_path']} {settings.get_param_value('color')}")
+
+        add_command("alpha")
+        add_command("beta")
+
+        runner = CliRunner()
+        outputs = [runner.invoke(cli, [name]).output.strip() for name in ("alpha", "beta", "alpha")]
+        self.assertEqual(outputs, ["alpha red", "beta blue", "alpha red"])
+
+
+if __name__ == "__main__":
+    unittest.main()
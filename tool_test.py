@@ -20,9 +20,6 @@ def run(command_args):
     
     Example: python tool_test.py run config show
     """
-    # Enable settings
-    initialize_settings()
-    
     # Run the CLI with the provided arguments
     sys.argv = ['cli-tool'] + list(command_args)
     cli()
@@ -37,9 +34,6 @@ def test_get_page(folder, output, url):
     
     Example: python tool_test.py test_get_page --url https://example.com --folder ./pages
     """
-    # Enable settings
-    initialize_settings()
-    
     # Build arguments
     args = ['get-page', '--url', url]
     if folder:
@@ -56,11 +50,11 @@ def test_get_page(folder, output, url):
         print(f"\nTest failed: {str(e)}")
 
 if __name__ == '__main__':
+    # Enable settings once, whichever way the CLI is run
+    initialize_settings()
+    
     if len(sys.argv) > 1:
         test_cli()
     else:
-        # Enable settings
-        initialize_settings()
-        
         # Run the CLI with the provided arguments
         cli(sys.argv[1:])
\ No newline at end of file